@@ -13,13 +13,19 @@
 
 import logging
 import os
+from functools import partial
 from typing import final, List, Optional
 
+import flatbuffers
 import serializer.tosa_serializer as ts
+import torch
 from executorch.backends.arm.arm_vela import vela_compile
 from executorch.backends.arm.operators.node_visitor import get_node_visitors
 from executorch.backends.arm.operators.op_output import process_output
-from executorch.backends.arm.operators.op_placeholder import process_placeholder
+from executorch.backends.arm.operators.op_placeholder import (
+    get_input_specs,
+    process_placeholder,
+)
 from executorch.backends.arm.passes.arm_pass_manager import ArmPassManager
 from executorch.backends.arm.tosa_utils import (
     dbg_fail,
@@ -172,6 +178,30 @@ def get_intermediate_path(compile_spec: List[CompileSpec]) -> Optional[str]:
     return None
 
 
+def _constant_data_size(edge_program: ExportedProgram) -> int:
+    """Number of bytes of parameters, buffers and constants in edge_program."""
+    return sum(
+        t.numel() * t.element_size()
+        for t in (
+            *edge_program.state_dict.values(),
+            *edge_program.tensor_constants.values(),
+        )
+        if isinstance(t, torch.Tensor)
+    )
+
+
+def _presize_builder(tosa_graph: ts.TosaSerializer, size: int) -> None:
+    """
+    Replace the serializer's flatbuffer builder with one of initial capacity
+    size, so serializing large constants does not grow and copy the buffer
+    repeatedly. Relies on the serialization_lib v0.80 TosaSerializer creating
+    self.builder in __init__ and writing into it in serialize(). Serializers
+    without that attribute are left as they are.
+    """
+    if hasattr(tosa_graph, "builder"):
+        tosa_graph.builder = flatbuffers.Builder(size)
+
+
 def _get_first_delegation_tag(graph_module) -> str | None:
     """Get the first delegation tag from the graph_module or return None."""
     for node in graph_module.graph.nodes:
@@ -221,18 +251,39 @@ class ArmBackend(BackendDetails):
         )
 
         node_visitors = get_node_visitors(edge_program)
+        input_specs = get_input_specs(edge_program)
+
+        # Handlers per node.op, bound to this graph's state once
+        node_handlers = {
+            "call_function": partial(
+                process_call_function,
+                tosa_graph=tosa_graph,
+                node_visitors=node_visitors,
+            ),
+            "placeholder": partial(
+                process_placeholder,
+                tosa_graph=tosa_graph,
+                edge_program=edge_program,
+                input_specs=input_specs,
+            ),
+            "output": partial(process_output, tosa_graph=tosa_graph),
+        }
 
         for node in graph_module.graph.nodes:
-            if node.op == "call_function":
-                process_call_function(node, tosa_graph, node_visitors)
-            elif node.op == "placeholder":
-                process_placeholder(node, tosa_graph, edge_program)
-            elif node.op == "output":
-                process_output(node, tosa_graph)
-            else:
+            handler = node_handlers.get(node.op)
+            if handler is None:
                 # This will only happen if an unpartitioned graph is passed without
                 # any checking of compatibility.
                 dbg_fail(node, tosa_graph, artifact_path)
+            else:
+                handler(node)
+
+        # Serialize once, the same flatbuffer is used for the debug dump and
+        # the returned binary. Constant data is embedded in the flatbuffer, so
+        # size the builder for it up front rather than letting it grow (and
+        # copy everything written so far) repeatedly while serializing.
+        _presize_builder(tosa_graph, _constant_data_size(edge_program) + (1 << 20))
+        tosa_flatbuffer = bytes(tosa_graph.serialize())
 
         # TODO: It would be awesome if this dump could somehow be done on top level and not here.
         # Problem is that the desc.json has to be created on the tosa_graph object, which we can't
@@ -243,6 +294,7 @@ class ArmBackend(BackendDetails):
                 tosa_graph,
                 artifact_path,
                 suffix="{}".format(f"_{tag}" if tag else ""),
+                tosa_flatbuffer=tosa_flatbuffer,
             )
 
         # Serialize and return the program. While we have always produced TOSA
@@ -250,10 +302,10 @@ class ArmBackend(BackendDetails):
         # preprocess and some consume TOSA fb directly.
         if output_format == "vela":
             # Emit vela_bin_stream format
-            binary = vela_compile(tosa_graph, compile_flags)
+            binary = vela_compile(tosa_flatbuffer, compile_flags)
         elif output_format == "tosa":
             # Emit TOSA flatbuffer
-            binary = bytes(tosa_graph.serialize())
+            binary = tosa_flatbuffer
         else:
             raise RuntimeError(f"Unknown format {output_format}")
 
@@ -8,10 +8,12 @@
 import logging
 import operator
 import os
+import sys
 from typing import final, List
 
 import torch
 from executorch.backends.arm.arm_backend import ArmBackend
+from executorch.backends.arm.passes.decompose_div_pass import DecomposeDivPass
 from executorch.backends.arm.passes.tag_io_quant_pass import TagIOQuantPass
 from executorch.exir.backend.compile_spec_schema import CompileSpec
 from executorch.exir.backend.partitioner import (
@@ -35,40 +37,47 @@ if TOSA_DBG_VERBOSE:
     logger.setLevel(logging.INFO)
 
 
+# Edge dialect targets lowered by the TOSA backend. Kept as a frozenset so
+# the per-node check in is_node_supported is a single hash lookup.
+_SUPPORTED_TARGETS = frozenset(
+    {
+        exir_ops.edge.aten.add.Tensor,
+        exir_ops.edge.aten.addmm.default,
+        exir_ops.edge.aten.expand_copy.default,
+        exir_ops.edge.aten.cat.default,
+        exir_ops.edge.aten.bmm.default,
+        exir_ops.edge.aten.permute_copy.default,
+        exir_ops.edge.aten.hardtanh.default,
+        exir_ops.edge.aten.convolution.default,
+        exir_ops.edge.aten.div.Tensor,
+        exir_ops.edge.aten.exp.default,
+        exir_ops.edge.aten.log.default,
+        exir_ops.edge.aten.split_with_sizes_copy.default,
+        exir_ops.edge.aten.full.default,
+        exir_ops.edge.aten.mul.Tensor,
+        exir_ops.edge.aten._native_batch_norm_legit_no_training.default,
+        exir_ops.edge.aten.avg_pool2d.default,
+        exir_ops.edge.aten.sigmoid.default,
+        exir_ops.edge.aten.mm.default,
+        exir_ops.edge.aten.repeat.default,
+        exir_ops.edge.aten.relu.default,
+        exir_ops.edge.aten._softmax.default,
+        exir_ops.edge.aten.slice_copy.Tensor,
+        exir_ops.edge.aten.sub.Tensor,
+        exir_ops.edge.aten.view_copy.default,
+        exir_ops.edge.aten.clone.default,
+        exir_ops.edge.aten.mean.dim,
+        exir_ops.edge.aten.unsqueeze_copy.default,
+        operator.getitem,
+        exir_ops.edge.quantized_decomposed.quantize_per_tensor.default,
+        exir_ops.edge.quantized_decomposed.dequantize_per_tensor.default,
+    }
+)
+
+
 class TOSASupportedOperators(OperatorSupportBase):
     def is_node_supported(self, submodules, node: torch.fx.Node) -> bool:
-        supported = node.op == "call_function" and node.target in [
-            exir_ops.edge.aten.add.Tensor,
-            exir_ops.edge.aten.addmm.default,
-            exir_ops.edge.aten.expand_copy.default,
-            exir_ops.edge.aten.cat.default,
-            exir_ops.edge.aten.bmm.default,
-            exir_ops.edge.aten.permute_copy.default,
-            exir_ops.edge.aten.hardtanh.default,
-            exir_ops.edge.aten.convolution.default,
-            exir_ops.edge.aten.div.Tensor,
-            exir_ops.edge.aten.exp.default,
-            exir_ops.edge.aten.log.default,
-            exir_ops.edge.aten.split_with_sizes_copy.default,
-            exir_ops.edge.aten.full.default,
-            exir_ops.edge.aten.mul.Tensor,
-            exir_ops.edge.aten._native_batch_norm_legit_no_training.default,
-            exir_ops.edge.aten.avg_pool2d.default,
-            exir_ops.edge.aten.sigmoid.default,
-            exir_ops.edge.aten.mm.default,
-            exir_ops.edge.aten.repeat.default,
-            exir_ops.edge.aten.relu.default,
-            exir_ops.edge.aten._softmax.default,
-            exir_ops.edge.aten.slice_copy.Tensor,
-            exir_ops.edge.aten.sub.Tensor,
-            exir_ops.edge.aten.view_copy.default,
-            exir_ops.edge.aten.clone.default,
-            exir_ops.edge.aten.mean.dim,
-            exir_ops.edge.aten.unsqueeze_copy.default,
-            operator.getitem,
-            exir_ops.edge.quantized_decomposed.quantize_per_tensor.default,
-            exir_ops.edge.quantized_decomposed.dequantize_per_tensor.default,
-        ]
+        supported = node.op == "call_function" and node.target in _SUPPORTED_TARGETS
 
         supported &= self.is_node_supported_custom(node)
 
@@ -85,6 +94,10 @@ class TOSASupportedOperators(OperatorSupportBase):
             keep_dim = node.args[2]
             if dim != [-1, -2] or keep_dim is False:
                 return False
+        if node.target == exir_ops.edge.aten.div.Tensor:
+            # Lowered through DecomposeDivPass, which needs a tensor denominator
+            if not DecomposeDivPass.is_decomposable(node):
+                return False
         return True
 
 
@@ -116,10 +129,11 @@ class ArmPartitioner(Partitioner):
         )
         partition_list = capability_partitioner.propose_partitions()
         for partition in partition_list:
+            # One interned tag per partition, shared by all of its nodes
+            tag = sys.intern(f"tag{partition.id}")
             for node in partition.nodes:
-                tag = f"tag{partition.id}"
                 node.meta["delegation_tag"] = tag
-                partition_tags[tag] = self.delegation_spec
+            partition_tags[tag] = self.delegation_spec
 
         tag_constant_data(exported_program)
 
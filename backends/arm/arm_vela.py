@@ -5,15 +5,27 @@
 
 # pyre-unsafe
 
+import hashlib
+import logging
 import os
 import struct
 import tempfile
+from collections import OrderedDict
 
-from typing import List
+from typing import List, Optional, Tuple
 
 import numpy as np
 from ethosu.vela import vela
 
+logger = logging.getLogger(__name__)
+
+
+def _as_uint8(buffer) -> np.ndarray:
+    """Flat uint8 view of a bytes object or ndarray, copying only if needed."""
+    if isinstance(buffer, np.ndarray):
+        return np.ascontiguousarray(buffer).reshape(-1).view(np.uint8)
+    return np.frombuffer(buffer, dtype=np.uint8)
+
 
 # Pack either input or output tensor block, compose the related arrays into
 # per-io structs to simplify runtime use.
@@ -33,22 +45,87 @@ def vela_bin_pack_io(prefix, data):
     return ios
 
 
+def _cache_size_from_env() -> int:
+    value = os.environ.get("ARM_VELA_CACHE_SIZE", "0")
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        logger.warning("Ignoring invalid ARM_VELA_CACHE_SIZE=%r", value)
+        return 0
+
+
+# Vela output is fully determined by the TOSA flatbuffer, the compiler flags and
+# the config files those flags name, so recent results can be kept keyed on a
+# digest of all three. This lets repeated lowering of an unchanged partition
+# (e.g. in test loops) skip Vela. Each entry holds a full binary including all
+# weights, so caching is off unless ARM_VELA_CACHE_SIZE gives a number of
+# entries to keep.
+_VELA_CACHE_SIZE = _cache_size_from_env()
+_vela_cache: "OrderedDict[Tuple, bytes]" = OrderedDict()
+
+
+def clear_vela_cache():
+    """Drop all cached Vela results."""
+    _vela_cache.clear()
+
+
+def _config_digests(args: List[str]) -> Optional[Tuple[Tuple[str, bytes], ...]]:
+    """
+    Digest of every file named by a --config= flag in args, or None if one of
+    them can not be read, in which case the result must not be cached.
+    """
+    digests = []
+    for arg in " ".join(args).split(" "):
+        if not arg.startswith("--config="):
+            continue
+        config = arg[len("--config=") :]
+        # Vela looks up configs it can not find in its bundled config files
+        path = config
+        if not os.path.isfile(path):
+            path = os.path.join(getattr(vela, "CONFIG_FILES_PATH", ""), config)
+        try:
+            with open(path, "rb") as f:
+                digests.append((config, hashlib.sha256(f.read()).digest()))
+        except OSError:
+            return None
+    return tuple(digests)
+
+
 # Output via Vela to binary stream for ArmBackendEthosU
 # WARNING: Do not change this without changing VelaBinStream.cpp as that
 #          function consumes this format and the two need to align.
-def vela_compile(tosa_graph, args: List[str]):
+def vela_compile(tosa_flatbuffer: bytes, args: List[str]) -> bytes:
+    config_digests = _config_digests(args) if _VELA_CACHE_SIZE > 0 else None
+    if config_digests is None:
+        return _vela_compile(tosa_flatbuffer, args)
+
+    key = (hashlib.sha256(tosa_flatbuffer).digest(), tuple(args), config_digests)
+    if key in _vela_cache:
+        logger.info("Reusing cached Vela output, Vela was not invoked")
+        _vela_cache.move_to_end(key)
+        return _vela_cache[key]
+
+    binary = _vela_compile(tosa_flatbuffer, args)
+
+    _vela_cache[key] = binary
+    if len(_vela_cache) > _VELA_CACHE_SIZE:
+        _vela_cache.popitem(last=False)
+    return binary
+
+
+def _vela_compile(tosa_flatbuffer: bytes, args: List[str]) -> bytes:
     with tempfile.TemporaryDirectory() as tmpdir:
         tosaname = "out.tosa"
-        flatbuffer = tosa_graph.serialize()
         tosa_path = os.path.join(tmpdir, tosaname)
         with open(tosa_path, "wb") as f:
-            f.write(flatbuffer)
+            f.write(tosa_flatbuffer)
 
-        # invoke vela
+        # invoke vela in-process; it only accepts file paths for its input and
+        # output, so the flatbuffer has to round-trip through tmpdir.
         output_dir = os.path.join(tmpdir, "output")
-        args.append(f"--output-dir={output_dir}")
-        args.append(tosa_path)
-        vela.main(" ".join(args).split(" "))
+        vela_args = " ".join(args).split(" ")
+        vela_args += [f"--output-dir={output_dir}", tosa_path]
+        vela.main(vela_args)
 
         if any("ethos-u85" in arg for arg in args) or any(
             "debug-force-regor" in arg for arg in args
@@ -56,18 +133,18 @@ def vela_compile(tosa_graph, args: List[str]):
             np_path = os.path.join(tmpdir, "output", "out_vela.npz")
         else:
             np_path = os.path.join(tmpdir, "output", "out_sg0_vela.npz")
-        blocks = b""
 
         with np.load(np_path, allow_pickle=False) as data:
             # Construct our modified output_blocks with data in a form easily
-            # digested on the device side
-            bin_blocks = {"vela_bin_stream": b""}
+            # digested on the device side. Blocks are kept as flat uint8 views
+            # so they can be copied straight into the output buffer below.
+            bin_blocks = {"vela_bin_stream": np.empty(0, dtype=np.uint8)}
 
             # copy command data through unmodified
-            bin_blocks["cmd_data"] = data["cmd_data"].tobytes()
+            bin_blocks["cmd_data"] = _as_uint8(data["cmd_data"])
 
             # copy weight data through unmodified
-            bin_blocks["weight_data"] = data["weight_data"].tobytes()
+            bin_blocks["weight_data"] = _as_uint8(data["weight_data"])
 
             # Add a block for scratch, inputs and outputs;  scratch shape is a 1 element
             # array giving us size in bytes so extract this and add a block of 0's.
@@ -75,31 +152,37 @@ def vela_compile(tosa_graph, args: List[str]):
             if not isinstance(data["scratch_shape"][0], np.int64):
                 raise RuntimeError("Expected scratch to be int64")
             block_length = int(data["scratch_shape"][0])
-            bin_blocks["scratch_data"] = b"\x00" * block_length
+            bin_blocks["scratch_data"] = np.zeros(block_length, dtype=np.uint8)
 
             # Capture inputs and outputs
-            bin_blocks["inputs"] = vela_bin_pack_io("input", data)
-            bin_blocks["outputs"] = vela_bin_pack_io("output", data)
+            bin_blocks["inputs"] = _as_uint8(vela_bin_pack_io("input", data))
+            bin_blocks["outputs"] = _as_uint8(vela_bin_pack_io("output", data))
 
-            bin_blocks["vela_end_stream"] = b""
+            bin_blocks["vela_end_stream"] = np.empty(0, dtype=np.uint8)
 
             # Emit the NPZ regions as:
             #  - 16 byte block name null terminated string (padded to 16 if name shorter)
             #  - 4 bytes of int32 block length and 12 bytes of 0's
             #  - block data (padded to 16 byte alignment at end)
             # Repeat for all blocks
-            for key in bin_blocks.keys():
-                block_name = bytes(key, "utf8")[:15]
-                block_name = block_name + b"\x00" * (16 - len(block_name))
+            # The output is sized up front and zero filled, so name and data
+            # padding need no explicit writes.
+            total = sum(
+                32 + block.size + (-block.size % 16) for block in bin_blocks.values()
+            )
+            blocks = np.zeros(total, dtype=np.uint8)
+            offset = 0
+            for key, block_data in bin_blocks.items():
+                block_name = key.encode("utf8")[:15]
+                blocks[offset : offset + len(block_name)] = _as_uint8(block_name)
 
                 # We need the acual unpadded block lengths for hw setup
-                block_length = struct.pack("<iiii", len(bin_blocks[key]), 0, 0, 0)
+                block_length = struct.pack("<iiii", block_data.size, 0, 0, 0)
+                blocks[offset + 16 : offset + 32] = _as_uint8(block_length)
+                offset += 32
 
                 # Pad block data to multiple of 16 bytes
-                block_data = bin_blocks[key]
-                block_data = block_data + b"\x00" * (15 - (len(block_data) - 1) % 16)
-
-                block = block_name + block_length + block_data
-                blocks = blocks + block
+                blocks[offset : offset + block_data.size] = block_data
+                offset += block_data.size + (-block_data.size % 16)
 
-        return blocks
+        return blocks.tobytes()
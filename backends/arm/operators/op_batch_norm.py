@@ -13,7 +13,11 @@ from executorch.backends.arm.operators.node_visitor import (
     register_node_visitor,
 )
 from executorch.backends.arm.tosa_mapping import TosaArg
-from executorch.backends.arm.tosa_utils import promote_shape, tosa_shape
+from executorch.backends.arm.tosa_utils import (
+    mul_attribute,
+    promote_shape,
+    tosa_shape,
+)
 from serializer.tosa_serializer import TosaOp
 
 
@@ -46,6 +50,9 @@ class BatchNormVisitor(NodeVisitor):
 
         input_dtype = activations.dtype
 
+        # All MUL operators in the decomposition share the same attribute
+        attr_mul = mul_attribute(0)
+
         assert (
             0.1 == momentum.number
         ), "Expected 0.1 momentum, not currently encoded into TOSA"
@@ -107,8 +114,6 @@ class BatchNormVisitor(NodeVisitor):
         if not weights.name and not bias.name:
             # Multiply shifted activations with reciprocal variance
             # %output = tosa.MUL(%op1, %op3)  e.g. Now we have %output = (%activations - %running_mean) /  SQRT( %running_var + %epsilon_const )
-            attr_mul = ts.TosaSerializerAttribute()
-            attr_mul.MulAttribute(0)
             tosa_graph.addOperator(
                 TosaOp.Op().MUL, [op1.name, op3_reshaped.name], [output.name], attr_mul
             )
@@ -119,8 +124,6 @@ class BatchNormVisitor(NodeVisitor):
             op4 = tosa_graph.addIntermediate(
                 tosa_shape(output.shape, output.dim_order), input_dtype
             )
-            attr_mul = ts.TosaSerializerAttribute()
-            attr_mul.MulAttribute(0)
             tosa_graph.addOperator(
                 TosaOp.Op().MUL, [op1.name, op3_reshaped.name], [op4.name], attr_mul
             )
@@ -139,8 +142,6 @@ class BatchNormVisitor(NodeVisitor):
             )
 
             # %output = tosa.MUL(%op4, %weights)
-            attr_mul = ts.TosaSerializerAttribute()
-            attr_mul.MulAttribute(0)
             tosa_graph.addOperator(
                 TosaOp.Op().MUL,
                 [op4.name, weights_reshaped.name],
@@ -182,8 +183,6 @@ class BatchNormVisitor(NodeVisitor):
         op5 = tosa_graph.addIntermediate(
             tosa_shape(output.shape, output.dim_order), input_dtype
         )
-        attr_mul = ts.TosaSerializerAttribute()
-        attr_mul.MulAttribute(0)
         tosa_graph.addOperator(
             TosaOp.Op().MUL,
             [op4.name, weights_reshaped.name],
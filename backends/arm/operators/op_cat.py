@@ -13,6 +13,7 @@ from executorch.backends.arm.operators.node_visitor import (
     register_node_visitor,
 )
 from executorch.backends.arm.tosa_mapping import TosaArg
+from executorch.backends.arm.tosa_utils import axis_attribute
 from serializer.tosa_serializer import TosaOp
 from torch.fx import Node
 
@@ -39,9 +40,9 @@ class CatVisitor(NodeVisitor):
         dim = (dim + rank) % rank
         dim = output.dim_order.index(dim)
 
-        attr = ts.TosaSerializerAttribute()
-        attr.AxisAttribute(dim)
-
         tosa_graph.addOperator(
-            TosaOp.Op().CONCAT, [tensor.name for tensor in tensors], [output.name], attr
+            TosaOp.Op().CONCAT,
+            [tensor.name for tensor in tensors],
+            [output.name],
+            axis_attribute(dim),
         )
@@ -65,8 +65,6 @@ class MulVisitor(NodeVisitor):
             mul_output = tosa_graph.addIntermediate(output_shape, ts.DType.INT32)
 
             # Do the INT32 Mul
-            attr = ts.TosaSerializerAttribute()
-            attr.MulAttribute(shift=0)
             tosa_graph.addOperator(
                 TosaOp.Op().MUL,
                 [
@@ -74,7 +72,7 @@ class MulVisitor(NodeVisitor):
                     input_B_rescaled.name,
                 ],
                 [mul_output.name],
-                attr,
+                tutils.mul_attribute(0),
             )
 
             tqutils.rescale_node_back_to_int8(
@@ -82,8 +80,9 @@ class MulVisitor(NodeVisitor):
             )
 
         else:
-            attr = ts.TosaSerializerAttribute()
-            attr.MulAttribute(shift=0)
             tosa_graph.addOperator(
-                TosaOp.Op().MUL, [inputs[0].name, inputs[1].name], [output.name], attr
+                TosaOp.Op().MUL,
+                [inputs[0].name, inputs[1].name],
+                [output.name],
+                tutils.mul_attribute(0),
             )
@@ -15,7 +15,7 @@ def process_output(
     node: torch.fx.Node,
     tosa_graph: ts.TosaSerializer,
 ):
+    tensors = tosa_graph.currRegion.currBasicBlock.tensors
+    add_output_tensor = tosa_graph.addOutputTensor
     for output in cast(tuple[torch.fx.Node, ...], node.args[0]):
-        tosa_graph.addOutputTensor(
-            tosa_graph.currRegion.currBasicBlock.tensors[output.name]
-        )
+        add_output_tensor(tensors[output.name])
@@ -5,6 +5,8 @@
 
 # pyre-unsafe
 
+from typing import Dict, Optional
+
 import numpy as np
 import serializer.tosa_serializer as ts
 import torch.fx
@@ -20,7 +22,27 @@ from executorch.backends.arm.tosa_utils import (
     tosa_shape,
 )
 from executorch.exir.dialects._ops import ops as exir_ops
+from ml_dtypes import bfloat16
 from torch.export.exported_program import ExportedProgram
+from torch.export.graph_signature import InputKind, InputSpec
+
+
+def _tensor_to_numpy(tensor: torch.Tensor) -> np.ndarray:
+    """
+    Convert a constant tensor to numpy. Contiguous tensors share memory with
+    the returned array, others are made contiguous once here rather than being
+    handed to the serializer as a strided view.
+    """
+    assert isinstance(tensor, torch.Tensor), "Expect Attr to be tensor"
+    if tensor.requires_grad:
+        tensor = tensor.detach()
+    if not tensor.is_contiguous():
+        tensor = tensor.contiguous()
+    if tensor.dtype == torch.bfloat16:
+        # numpy has no bfloat16 and Tensor.numpy() refuses it, reinterpret the
+        # bits as the ml_dtypes bfloat16 the serializer uses for BF16 data.
+        return tensor.view(torch.int16).numpy().view(bfloat16)
+    return tensor.numpy()
 
 
 def process_inputs(
@@ -28,15 +50,17 @@ def process_inputs(
     tosa_graph: ts.TosaSerializer,
 ):
     """Serialize an input node"""
-    inputs = [TosaArg(node)]
-    input_shape = inputs[0].shape
-    input_dim_order = inputs[0].dim_order
-    tensor = ts.TosaSerializerTensor(
-        inputs[0].name,
-        tosa_shape(input_shape, input_dim_order),
-        get_quant_arg_dtype(node) if is_quant_arg(node) else inputs[0].dtype,
-        data=None,
-        placeholderFilename=inputs[0].name + ".npy",
+    arg = TosaArg(node)
+    # Add the tensor to the block directly. addInputTensor copies the fields of
+    # the tensor it is given into a new block tensor unless one with the same
+    # name exists, so building a standalone TosaSerializerTensor for it would
+    # construct every input twice.
+    tensor = tosa_graph.currRegion.currBasicBlock.addTensor(
+        arg.name,
+        tosa_shape(arg.shape, arg.dim_order),
+        get_quant_arg_dtype(node) if is_quant_arg(node) else arg.dtype,
+        None,
+        f"{arg.name}.npy",
     )
     tosa_graph.addInputTensor(tensor)
 
@@ -88,14 +112,12 @@ def process_inputs_to_parameters(
     node: torch.fx.Node,
     tosa_graph: ts.TosaSerializer,
     edge_program: ExportedProgram,
+    parameter_name: str,
 ):
     """Serialize bias and non-quantized weights"""
     inputs = [TosaArg(node)]
-    parameter_name = edge_program.graph_signature.inputs_to_parameters[node.name]
     parameter_data = edge_program.state_dict[parameter_name]
-
-    assert isinstance(parameter_data, torch.Tensor), "Expect Attr to be tensor"
-    parameter_values = parameter_data.detach().numpy()
+    parameter_values = _tensor_to_numpy(parameter_data)
 
     if is_bias_node_for_quantized_addmm(node) or is_bias_node_for_quantized_conv(node):
         # BI bias
@@ -113,14 +135,12 @@ def process_inputs_to_buffers(
     node: torch.fx.Node,
     tosa_graph: ts.TosaSerializer,
     edge_program: ExportedProgram,
+    buffer_name: str,
 ):
     """Serialize quantized weights"""
     inputs = [TosaArg(node)]
-    buffer_name = edge_program.graph_signature.inputs_to_buffers[node.name]
     buffer_data = edge_program.state_dict[buffer_name]
-
-    assert isinstance(buffer_data, torch.Tensor), "Expect Attr to be tensor"
-    buffer_values = buffer_data.detach().numpy()
+    buffer_values = _tensor_to_numpy(buffer_data)
 
     # TODO: fragile code for temporary fix
     # the mean and var tensors are also stored here but they have shape (1, )
@@ -136,35 +156,54 @@ def process_inputs_to_lifted_tensor_constants(
     node: torch.fx.Node,
     tosa_graph: ts.TosaSerializer,
     edge_program: ExportedProgram,
+    tensor_name: str,
 ):
     arg = TosaArg(node)
-    tensor_name = edge_program.graph_signature.inputs_to_lifted_tensor_constants[
-        arg.name
-    ]
     tensor = edge_program.tensor_constants[tensor_name]
-    tensor_data = tensor.detach().numpy()
+    tensor_data = _tensor_to_numpy(tensor)
 
     tosa_graph.addConst(tensor_data.shape, arg.dtype, tensor_data, name=arg.name)
 
 
+def get_input_specs(edge_program: ExportedProgram) -> Dict[str, InputSpec]:
+    """
+    Map placeholder names to their input spec. The graph signature rebuilds its
+    inputs_to_* mappings on every access, so callers processing many
+    placeholders should build this once and pass it to process_placeholder.
+    """
+    return {
+        spec.arg.name: spec
+        for spec in edge_program.graph_signature.input_specs
+        if hasattr(spec.arg, "name")
+    }
+
+
 def process_placeholder(
     node: torch.fx.Node,
     tosa_graph: ts.TosaSerializer,
     edge_program: ExportedProgram,
+    input_specs: Optional[Dict[str, InputSpec]] = None,
 ):
     """Wrapper for processing and serializing all types of placeholders"""
     assert node.name == node.target, "Expect placeholder name and target to match"
     assert 0 == len(node.args), "Can't handle default input values"
 
-    if node.name in edge_program.graph_signature.user_inputs:
+    if input_specs is None:
+        input_specs = get_input_specs(edge_program)
+    spec = input_specs.get(node.name)
+    kind = spec.kind if spec is not None else None
+
+    if kind == InputKind.USER_INPUT:
         process_inputs(node, tosa_graph)
-    elif node.name in edge_program.graph_signature.inputs_to_parameters:
-        process_inputs_to_parameters(node, tosa_graph, edge_program)
-    elif node.name in edge_program.graph_signature.inputs_to_buffers:
-        process_inputs_to_buffers(node, tosa_graph, edge_program)
-    elif node.name in edge_program.graph_signature.inputs_to_lifted_tensor_constants:
-        process_inputs_to_lifted_tensor_constants(node, tosa_graph, edge_program)
-    elif node.name in edge_program.graph_signature.inputs_to_lifted_custom_objs:
+    elif kind == InputKind.PARAMETER:
+        process_inputs_to_parameters(node, tosa_graph, edge_program, spec.target)
+    elif kind == InputKind.BUFFER:
+        process_inputs_to_buffers(node, tosa_graph, edge_program, spec.target)
+    elif kind == InputKind.CONSTANT_TENSOR:
+        process_inputs_to_lifted_tensor_constants(
+            node, tosa_graph, edge_program, spec.target
+        )
+    elif kind == InputKind.CUSTOM_OBJ:
         raise NotImplementedError(
             "Placeholder is of type 'lifted custom object' which is not supported."
         )
@@ -13,7 +13,11 @@ from executorch.backends.arm.operators.node_visitor import (
     register_node_visitor,
 )
 from executorch.backends.arm.tosa_mapping import TosaArg
-from executorch.backends.arm.tosa_utils import tosa_shape
+from executorch.backends.arm.tosa_utils import (
+    axis_attribute,
+    mul_attribute,
+    tosa_shape,
+)
 from serializer.tosa_serializer import TosaOp
 
 
@@ -47,8 +51,7 @@ class SoftmaxVisitor(NodeVisitor):
         # output = mul(exp_res, inverted_reduce_sum)
 
         # Max_Reduction
-        attr_axis = ts.TosaSerializerAttribute()
-        attr_axis.AxisAttribute(axis=dim_value)
+        attr_axis = axis_attribute(dim_value)
         reduced_shape = list(input_shape)
         reduced_shape[dim_value] = 1
         reduce_max_res = tosa_graph.addIntermediate(reduced_shape, output.dtype)
@@ -89,11 +92,9 @@ class SoftmaxVisitor(NodeVisitor):
         )
 
         # Multiply two parts to get the final results
-        attr_mul = ts.TosaSerializerAttribute()
-        attr_mul.MulAttribute(0)
         tosa_graph.addOperator(
             TosaOp.Op().MUL,
             [exp_res.name, inverted_reduce_sum.name],
             [output.name],
-            attr_mul,
+            mul_attribute(0),
         )
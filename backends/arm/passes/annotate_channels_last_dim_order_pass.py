@@ -13,6 +13,9 @@ from executorch.backends.arm.tosa_quant_utils import dq_op
 from executorch.backends.arm.tosa_utils import is_consumer_node_depthwise_conv2d
 from executorch.exir.pass_base import ExportPass, PassResult
 
+NHWC_ORDER = (0, 2, 3, 1)
+HWCM_ORDER = (2, 3, 0, 1)
+
 
 class AnnotateChannelsLastDimOrder(ExportPass):
     """
@@ -49,8 +52,6 @@ class AnnotateChannelsLastDimOrder(ExportPass):
         return False
 
     def call(self, graph_module: torch.fx.GraphModule):
-        NHWC_Order = (0, 2, 3, 1)
-        HWCM_Order = (2, 3, 0, 1)
         for node in graph_module.graph.nodes:
             if isinstance(
                 node.meta["val"], (tuple, torch.fx.immutable_collections.immutable_list)
@@ -60,11 +61,11 @@ class AnnotateChannelsLastDimOrder(ExportPass):
                 node_data = node.meta["val"].data
 
             if len(node_data.shape) == 4:
-                dim_order = NHWC_Order
+                dim_order = NHWC_ORDER
                 if self.is_weight_node_for_depthwise_conv2d(node):
                     # The weights of TOSA DEPTHWISE_CONV2D have shape (H, W, C, M) which corresponds to
                     # dim_order = (2, 3, 0, 1) (https://www.mlplatform.org/tosa/tosa_spec.html#_depthwise_conv2d).
-                    dim_order = HWCM_Order
+                    dim_order = HWCM_ORDER
             else:
                 dim_order = tuple(range(node_data.dim()))
             node.meta["tosa_dim_order"] = dim_order
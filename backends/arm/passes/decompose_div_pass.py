@@ -0,0 +1,71 @@
+# Copyright 2024 Arm Limited and/or its affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-unsafe
+
+import torch
+from executorch.exir.dialects._ops import ops as exir_ops
+from executorch.exir.pass_base import ExportPass, PassResult
+
+
+class DecomposeDivPass(ExportPass):
+    """
+    Decompose div into mul and reciprocal, x / y -> x * reciprocal(y), as TOSA
+    has no division operator for floating point. Doing this on the graph
+    rather than in the operator lowering lets divisions by the same tensor
+    share a single reciprocal.
+    """
+
+    div = exir_ops.edge.aten.div.Tensor
+    mul = exir_ops.edge.aten.mul.Tensor
+    reciprocal = exir_ops.edge.aten.reciprocal.default
+
+    @staticmethod
+    def is_decomposable(node: torch.fx.Node) -> bool:
+        """Whether div node has the tensor / tensor form this pass rewrites."""
+        return (
+            len(node.args) == 2
+            and not node.kwargs
+            and isinstance(node.args[1], torch.fx.Node)
+        )
+
+    def call(self, graph_module: torch.fx.GraphModule):
+        graph = graph_module.graph
+        reciprocals = {}
+        for node in graph.nodes:
+            if node.op != "call_function" or node.target != self.div:
+                continue
+            if not self.is_decomposable(node):
+                # The partitioner only delegates divisions this pass can rewrite
+                raise RuntimeError(
+                    f"Unsupported division {node.name}: expected a tensor "
+                    f"denominator and no kwargs, got args={node.args} "
+                    f"kwargs={node.kwargs}"
+                )
+            numerator, denominator = node.args
+
+            reciprocal_node = reciprocals.get(denominator)
+            if reciprocal_node is None:
+                with graph.inserting_before(node):
+                    reciprocal_node = graph.create_node(
+                        "call_function", self.reciprocal, (denominator,)
+                    )
+                # Shared by every div on this denominator, so take the meta
+                # from the denominator rather than from any one of them.
+                reciprocal_node.meta = {"val": denominator.meta["val"]}
+                reciprocals[denominator] = reciprocal_node
+
+            with graph.inserting_before(node):
+                mul_node = graph.create_node(
+                    "call_function", self.mul, (numerator, reciprocal_node)
+                )
+                mul_node.meta = node.meta
+            node.replace_all_uses_with(mul_node)
+            graph.erase_node(node)
+
+        graph.eliminate_dead_code()
+        graph_module.recompile()
+        return PassResult(graph_module, True)
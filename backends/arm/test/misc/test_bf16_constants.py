@@ -0,0 +1,56 @@
+# Copyright 2024 Arm Limited and/or its affiliates.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import unittest
+
+import numpy as np
+import torch
+from executorch.backends.arm.operators.op_placeholder import _tensor_to_numpy
+from executorch.backends.arm.test import common
+from executorch.backends.arm.test.tester.arm_tester import ArmTester
+
+
+class AddBF16Weight(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.weight = torch.nn.Parameter(torch.randn(5, 10, dtype=torch.bfloat16))
+
+    def forward(self, x):
+        return x + self.weight
+
+
+class TestBF16Constants(unittest.TestCase):
+    """Tests serializing bfloat16 parameters as TOSA constants."""
+
+    def test_tensor_to_numpy_bf16_bit_exact(self):
+        parameter = torch.nn.Parameter(torch.randn(3, 7, dtype=torch.bfloat16))
+        values = _tensor_to_numpy(parameter)
+        assert values.shape == (3, 7)
+        assert values.dtype.itemsize == 2
+        np.testing.assert_array_equal(
+            values.view(np.int16), parameter.detach().view(torch.int16).numpy()
+        )
+
+    def test_tensor_to_numpy_bf16_non_contiguous(self):
+        tensor = torch.randn(4, 6, dtype=torch.bfloat16).t()
+        values = _tensor_to_numpy(tensor)
+        np.testing.assert_array_equal(
+            values.view(np.int16), tensor.contiguous().view(torch.int16).numpy()
+        )
+
+    def test_bf16_weight_tosa_MI(self):
+        (
+            ArmTester(
+                AddBF16Weight(),
+                example_inputs=(torch.randn(5, 10, dtype=torch.bfloat16),),
+                compile_spec=common.get_tosa_compile_spec(),
+            )
+            .export()
+            .to_edge()
+            .partition()
+            .check_count({"torch.ops.higher_order.executorch_call_delegate": 1})
+            .check_not(["executorch_exir_dialects_edge__ops_aten_add_Tensor"])
+            .to_executorch()
+        )
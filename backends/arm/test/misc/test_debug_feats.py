@@ -8,11 +8,15 @@ import logging
 import os
 import tempfile
 import unittest
+from unittest import mock
 
 import torch
+from executorch.backends.arm.arm_backend import ArmBackend, ArmCompileSpecBuilder
+from executorch.backends.arm.passes.arm_pass_manager import ArmPassManager
 from executorch.backends.arm.test import common
 
 from executorch.backends.arm.test.tester.arm_tester import ArmTester
+from executorch.exir import to_edge
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -149,3 +153,39 @@ class TestDumpOperatorsAndDtypes(unittest.TestCase):
             .dump_operator_distribution()
         )
         # Just test that there are no execeptions.
+
+
+class TestUnsupportedNodeWithoutArtifactPath(unittest.TestCase):
+    """Tests that an unsupported node fails with a RuntimeError even when no
+    debug_artifact_path is set in the compile spec."""
+
+    @staticmethod
+    def _add_unsupported_node(graph_module: torch.fx.GraphModule, compile_spec):
+        # Route the output through a call_method node, which preprocess has no
+        # handler for. Added after the pass pipeline, as the passes themselves
+        # reject call_method nodes.
+        graph = graph_module.graph
+        output_node = next(n for n in graph.nodes if n.op == "output")
+        result = output_node.args[0][0]
+        with graph.inserting_before(output_node):
+            unsupported = graph.call_method("neg", (result,))
+        unsupported.meta = result.meta.copy()
+        output_node.args = ((unsupported,),)
+        graph_module.recompile()
+        return graph_module
+
+    def test_unsupported_node_raises_runtime_error(self):
+        model = Linear(20, 30)
+        edge_program = to_edge(
+            torch.export.export(model, model.get_inputs())
+        ).exported_program()
+
+        compile_spec = ArmCompileSpecBuilder().tosa_compile_spec().build()
+        assert not any(spec.key == "debug_artifact_path" for spec in compile_spec)
+        with mock.patch.object(
+            ArmPassManager,
+            "transform_to_backend_pipeline",
+            side_effect=self._add_unsupported_node,
+        ):
+            with self.assertRaisesRegex(RuntimeError, "TOSA Internal Error"):
+                ArmBackend.preprocess(edge_program, compile_spec)
@@ -0,0 +1,100 @@
+# Copyright 2024 Arm Limited and/or its affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+from executorch.backends.arm import arm_vela
+
+
+def _fake_vela_main(args):
+    """Stand-in for vela.main writing a minimal compiled network."""
+    output_dir = next(
+        arg[len("--output-dir=") :] for arg in args if arg.startswith("--output-dir=")
+    )
+    os.makedirs(output_dir, exist_ok=True)
+    io = {
+        "_shape": [np.array([1, 4])],
+        "_elem_size": np.array([1]),
+        "_offset": np.array([0]),
+        "_region": np.array([1]),
+    }
+    np.savez(
+        os.path.join(output_dir, "out_sg0_vela.npz"),
+        cmd_data=np.arange(8, dtype=np.uint8),
+        weight_data=np.arange(4, dtype=np.uint8),
+        scratch_shape=np.array([16], dtype=np.int64),
+        **{f"input{k}": v for k, v in io.items()},
+        **{f"output{k}": v for k, v in io.items()},
+    )
+
+
+class TestVelaCache(unittest.TestCase):
+    """Tests that vela_compile only reuses a result for identical inputs."""
+
+    def setUp(self):
+        arm_vela.clear_vela_cache()
+        self.addCleanup(arm_vela.clear_vela_cache)
+
+        config_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(config_dir.cleanup)
+        self.config = os.path.join(config_dir.name, "vela.ini")
+        with open(self.config, "w") as f:
+            f.write("[System_Config.Test]\n")
+        self.args = [f"--accelerator-config=ethos-u55-128 --config={self.config}"]
+
+        patcher = mock.patch.object(arm_vela.vela, "main", side_effect=_fake_vela_main)
+        self.vela_main = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # The cache is opt-in, enable it for these tests
+        patcher = mock.patch.object(arm_vela, "_VELA_CACHE_SIZE", 8)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_identical_call_skips_vela(self):
+        first = arm_vela.vela_compile(b"tosa", self.args)
+        second = arm_vela.vela_compile(b"tosa", self.args)
+        self.assertEqual(first, second)
+        self.assertEqual(self.vela_main.call_count, 1)
+
+    def test_changed_flags_miss(self):
+        arm_vela.vela_compile(b"tosa", self.args)
+        arm_vela.vela_compile(b"tosa", self.args + ["--optimise=Size"])
+        self.assertEqual(self.vela_main.call_count, 2)
+
+    def test_changed_flatbuffer_miss(self):
+        arm_vela.vela_compile(b"tosa", self.args)
+        arm_vela.vela_compile(b"tosa2", self.args)
+        self.assertEqual(self.vela_main.call_count, 2)
+
+    def test_changed_config_file_miss(self):
+        arm_vela.vela_compile(b"tosa", self.args)
+        with open(self.config, "a") as f:
+            f.write("core_clock=500e6\n")
+        arm_vela.vela_compile(b"tosa", self.args)
+        self.assertEqual(self.vela_main.call_count, 2)
+
+    def test_clear_cache(self):
+        arm_vela.vela_compile(b"tosa", self.args)
+        arm_vela.clear_vela_cache()
+        arm_vela.vela_compile(b"tosa", self.args)
+        self.assertEqual(self.vela_main.call_count, 2)
+
+    def test_disabled_cache_always_runs_vela(self):
+        with mock.patch.object(arm_vela, "_VELA_CACHE_SIZE", 0):
+            arm_vela.vela_compile(b"tosa", self.args)
+            arm_vela.vela_compile(b"tosa", self.args)
+        self.assertEqual(self.vela_main.call_count, 2)
+
+    def test_cache_size_from_env(self):
+        for value, expected in ((None, 0), ("4", 4), ("-1", 0), ("lots", 0)):
+            env = {} if value is None else {"ARM_VELA_CACHE_SIZE": value}
+            with mock.patch.dict(os.environ, env, clear=True):
+                self.assertEqual(arm_vela._cache_size_from_env(), expected)
@@ -0,0 +1,83 @@
+# Copyright 2024 Arm Limited and/or its affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import unittest
+
+import torch
+from executorch.backends.arm.passes.decompose_div_pass import DecomposeDivPass
+
+from executorch.backends.arm.test import common
+from executorch.backends.arm.test.tester.arm_tester import ArmTester
+
+from executorch.backends.xnnpack.test.tester.tester import RunPasses
+
+
+class Div(torch.nn.Module):
+    def forward(self, x, y):
+        return x / y
+
+    def get_inputs(self):
+        return (torch.rand(1, 2, 5, 5), torch.rand(1, 2, 5, 5) + 1)
+
+
+class DivSameDenominator(torch.nn.Module):
+    def forward(self, x, y, z):
+        return x / z + y / z
+
+    def get_inputs(self):
+        return (
+            torch.rand(1, 2, 5, 5),
+            torch.rand(1, 2, 5, 5),
+            torch.rand(1, 2, 5, 5) + 1,
+        )
+
+
+class TestDecomposeDivPass(unittest.TestCase):
+    """
+    Tests the DecomposeDivPass which rewrites div into mul and reciprocal.
+    """
+
+    def test_tosa_MI_decompose_div(self):
+        module = Div()
+        test_pass_stage = RunPasses([DecomposeDivPass])
+        (
+            ArmTester(
+                module,
+                example_inputs=module.get_inputs(),
+                compile_spec=common.get_tosa_compile_spec(),
+            )
+            .export()
+            .to_edge()
+            .check(["executorch_exir_dialects_edge__ops_aten_div_Tensor"])
+            .run_passes(test_pass_stage)
+            .check_not(["executorch_exir_dialects_edge__ops_aten_div_Tensor"])
+            .check_count(
+                {
+                    "executorch_exir_dialects_edge__ops_aten_reciprocal_default": 1,
+                    "executorch_exir_dialects_edge__ops_aten_mul_Tensor": 1,
+                }
+            )
+        )
+
+    def test_tosa_MI_decompose_div_shared_reciprocal(self):
+        module = DivSameDenominator()
+        test_pass_stage = RunPasses([DecomposeDivPass])
+        (
+            ArmTester(
+                module,
+                example_inputs=module.get_inputs(),
+                compile_spec=common.get_tosa_compile_spec(),
+            )
+            .export()
+            .to_edge()
+            .run_passes(test_pass_stage)
+            .check_count(
+                {
+                    "executorch_exir_dialects_edge__ops_aten_reciprocal_default": 1,
+                    "executorch_exir_dialects_edge__ops_aten_mul_Tensor": 2,
+                }
+            )
+        )
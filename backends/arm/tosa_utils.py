@@ -7,9 +7,10 @@
 
 import logging
 import os
-from typing import Any, cast, Dict
+from functools import lru_cache
+from math import prod
+from typing import Any, cast, Dict, Optional
 
-import numpy as np
 import serializer.tosa_serializer as ts
 import torch
 from executorch.backends.arm.operators.node_visitor import NodeVisitor
@@ -34,30 +35,39 @@ if TOSA_DBG_VERBOSE:
 
 
 def dbg_node(node):
-    # Debug output of node information
+    # Debug output of node information, only reached from dbg_fail on the error
+    # path; nothing is formatted unless INFO logging is enabled.
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info("OP")
-    logger.info(f"  op is {node.op}")
-    logger.info(f"  name is {node.name}")
-    logger.info(f"  node target is {node.target}")
-    logger.info(f"  node args is {node.args}")
-    logger.info(f"  node kwargs is {node.kwargs}")
+    logger.info("  op is %s", node.op)
+    logger.info("  name is %s", node.name)
+    logger.info("  node target is %s", node.target)
+    logger.info("  node args is %s", node.args)
+    logger.info("  node kwargs is %s", node.kwargs)
     logger.info("  node.meta = ")
     for k, v in node.meta.items():
-        logger.info(f"    '{k}' = {v}")
+        logger.info("    '%s' = %s", k, v)
         if isinstance(v, list):
             for i in v:
-                logger.info(f"      {i} ")
+                logger.info("      %s ", i)
 
 
 # Output TOSA flatbuffer and test harness file
-def dbg_tosa_dump(tosa_graph: ts.TosaSerializer, path: str, suffix: str = ""):
+def dbg_tosa_dump(
+    tosa_graph: ts.TosaSerializer,
+    path: str,
+    suffix: str = "",
+    tosa_flatbuffer: Optional[bytes] = None,
+):
     filename = f"output{suffix}.tosa"
 
-    logger.info(f"Emitting debug output to: {path=}, {suffix=}")
+    logger.info("Emitting debug output to: path=%r, suffix=%r", path, suffix)
 
     os.makedirs(path, exist_ok=True)
 
-    fb = tosa_graph.serialize()
+    # Reuse the flatbuffer if the caller already serialized the graph
+    fb = tosa_flatbuffer if tosa_flatbuffer is not None else tosa_graph.serialize()
     js = tosa_graph.writeJson(filename)
 
     filepath_tosa_fb = os.path.join(path, filename)
@@ -72,10 +82,11 @@ def dbg_tosa_dump(tosa_graph: ts.TosaSerializer, path: str, suffix: str = ""):
 
 
 def dbg_fail(node, tosa_graph, path):
-    dbg_tosa_dump(tosa_graph, path)
-    logger.warn("Internal error due to poorly handled node:")
+    logger.warning("Internal error due to poorly handled node:")
     dbg_node(node)
-    logger.warn(f"Debug output captured in '{path}'.")
+    if path:
+        dbg_tosa_dump(tosa_graph, path)
+        logger.warning("Debug output captured in '%s'.", path)
     raise RuntimeError("TOSA Internal Error on node, enable logging for further info.")
 
 
@@ -83,7 +94,7 @@ def dbg_fail(node, tosa_graph, path):
 # Ref: TOSA 0.80.0 specification - 1.9.3. Data Layouts from
 # https://www.mlplatform.org/tosa/tosa_spec.html
 def promote_shape(tosa_fb, arg, promoted_shape, out_dtype):
-    assert np.prod(arg.shape) == np.prod(promoted_shape), "Incompatible promoted shape"
+    assert prod(arg.shape) == prod(promoted_shape), "Incompatible promoted shape"
     reshape_res = tosa_fb.addIntermediate(promoted_shape, out_dtype)
     attr = ts.TosaSerializerAttribute()
     attr.ReshapeAttribute(promoted_shape)
@@ -95,18 +106,17 @@ def promote_shape(tosa_fb, arg, promoted_shape, out_dtype):
 # E.g., TOSA 0.80.0 specification - 2.3.3 CONV2D shapes:
 # https://www.mlplatform.org/tosa/tosa_spec.html#_conv2d
 def transpose_helper(tosa_fb, input, new_order, out_dtype):
-    # Check new_order's length is equal to input rank
-    assert len(input.shape) == len(new_order), "Wrong shape order length"
+    rank = len(input.shape)
 
-    # Check no duplications
-    assert len(set(new_order)) == len(new_order), "Contain duplicated dim numbers"
+    # Check new_order's length is equal to input rank
+    assert rank == len(new_order), "Wrong shape order length"
 
-    # Check all dims are valid
+    # Check all dims are valid and there are no duplications
+    seen = set()
     for idx in new_order:
-        if idx < 0:
-            assert True, "Negative dim number"
-        elif idx >= len(input.shape):
-            assert True, "Dim is greater than input rank"
+        assert 0 <= idx < rank, f"Invalid dim {idx} for input of rank {rank}"
+        assert idx not in seen, "Contain duplicated dim numbers"
+        seen.add(idx)
 
     input_shape_transpoed = [input.shape[i] for i in new_order]
     attr = ts.TosaSerializerAttribute()
@@ -165,6 +175,23 @@ def build_reshape(tosa_fb, input_name, new_shape, output_name):
     tosa_fb.addOperator(TosaOp.Op().RESHAPE, [input_name], [output_name], attr)
 
 
+# Attributes only record their values and are emitted when the graph is
+# serialized, so identical ones can be shared between operators. The returned
+# objects are cached and must not be modified by callers.
+@lru_cache(maxsize=64)
+def mul_attribute(shift: int = 0) -> ts.TosaSerializerAttribute:
+    attr = ts.TosaSerializerAttribute()
+    attr.MulAttribute(shift)
+    return attr
+
+
+@lru_cache(maxsize=64)
+def axis_attribute(axis: int) -> ts.TosaSerializerAttribute:
+    attr = ts.TosaSerializerAttribute()
+    attr.AxisAttribute(axis)
+    return attr
+
+
 def is_permute_node_before_addmm(node):
     return (
         node.target == exir_ops.edge.aten.permute_copy.default
@@ -283,7 +310,7 @@ def get_two_inputs(node: Node, check: bool = False) -> tuple[Node, Node]:
 
 
 def tosa_shape(shape, dim_order):
-    return tuple([shape[dim] for dim in dim_order])
+    return tuple(map(shape.__getitem__, dim_order))
 
 
 def process_call_function(
@@ -291,12 +318,22 @@ def process_call_function(
     tosa_graph: ts.TosaSerializer,
     node_visitors: Dict[str, NodeVisitor],
 ):
+    # Look up the visitor first so unknown operators fail before any tensors
+    # are added to the graph.
+    # pyre-ignore[16]: Undefined attribute.
+    visitor = node_visitors.get(node.target.__name__)
+    if visitor is None:
+        raise RuntimeError(f"Unknown operator {node.target}")
+
     # Unpack arguments and convert
     inputs = getNodeArgs(node)
 
     # Convert output (this node itself)
     output = TosaArg(node)
 
+    # Walks the node's users and inputs, so only evaluate it once per node
+    quant_node = is_quant_node(node)
+
     tosa_graph.currRegion.currBasicBlock.addTensor(
         output.name,
         (
@@ -304,22 +341,17 @@ def process_call_function(
             if is_permute_node_before_addmm(node)
             else tosa_shape(output.shape, output.dim_order)
         ),
-        map_dtype(get_quant_node_dtype(node)) if is_quant_node(node) else output.dtype,
+        map_dtype(get_quant_node_dtype(node)) if quant_node else output.dtype,
     )
 
     # Visiting each Node
-    # pyre-ignore[16]: Undefined attribute.
-    if node.target.__name__ in node_visitors:
-        # pyre-ignore[16]: Undefined attribute.
-        node_visitors[node.target.__name__].define_node(
-            node,
-            tosa_graph,
-            inputs,
-            output,
-            is_quant_node(node),
-        )
-    else:
-        raise RuntimeError(f"Unknown operator {node.target}")
+    visitor.define_node(
+        node,
+        tosa_graph,
+        inputs,
+        output,
+        quant_node,
+    )
 
 
 def expand_dims(